@@ -6,66 +6,196 @@ collect_data.py - สคริปต์เก็บข้อมูลคุณ
 
 import csv
 import datetime
+import math
 import os
 import sys
 import time
-from typing import Dict
+from typing import Dict, Optional
 
 import speedtest  # เพิ่มการ import ไลบรารี speedtest
 
+CSV_HEADER = [
+    'timestamp',
+    'ping_ms',
+    'download_mbps',
+    'upload_mbps',
+    'server_name',
+    'server_location',
+    'status',
+    'profile',
+    'bytes_used',
+    'confidence'
+]
+
+# โปรไฟล์การวัด: ค่า None หมายถึงใช้ค่าตั้งต้นจาก speedtest.net
+# expected_bytes ใช้ประมาณการใช้ข้อมูลเมื่อยังไม่มีประวัติของโปรไฟล์นั้น
+MEASUREMENT_PROFILES = {
+    'full': {
+        'throughput': True,
+        'threads': None,
+        'download_sizes': None,
+        'download_count': None,
+        'upload_sizes': None,
+        'upload_count': None,
+        'length_seconds': None,
+        'confidence': 1.0,
+        'expected_bytes': 100_000_000
+    },
+    'light': {
+        'throughput': True,
+        'threads': 2,
+        'download_sizes': [350, 500, 750, 1000],
+        'download_count': 1,
+        'upload_sizes': [131072, 262144, 524288],
+        'upload_count': 2,
+        'length_seconds': 4,
+        'confidence': 0.8,
+        'expected_bytes': 6_000_000
+    },
+    'latency': {
+        'throughput': False,
+        'confidence': None,
+        'expected_bytes': 0
+    }
+}
+
+# เรียงจากโปรไฟล์ที่ละเอียดที่สุดไปหาประหยัดที่สุด
+PROFILE_ORDER = ['full', 'light', 'latency']
+
+# speedtest ไม่นับข้อมูลที่ใช้โหลด config, รายชื่อเซิร์ฟเวอร์ และวัด ping
+# จึงบวกค่าประมาณนี้เข้าไปในทุกการวัด
+OVERHEAD_BYTES = 200_000
+
+# ปริมาณข้อมูลที่ถือว่าผลความเร็วเชื่อถือได้เต็มที่
+CONFIDENT_BYTES = 5_000_000
+
+
+def apply_profile(st: speedtest.Speedtest, profile: Dict):
+    """
+    ปรับ config ของ speedtest ตามโปรไฟล์การวัด
+
+    Args:
+        st: อ็อบเจ็กต์ Speedtest ที่โหลด config แล้ว
+        profile: ค่าจาก MEASUREMENT_PROFILES
+    """
+    config = st.config
+    if profile['download_sizes'] is not None:
+        config['sizes']['download'] = list(profile['download_sizes'])
+    if profile['download_count'] is not None:
+        config['counts']['download'] = profile['download_count']
+    if profile['upload_sizes'] is not None:
+        config['sizes']['upload'] = list(profile['upload_sizes'])
+    if profile['upload_count'] is not None:
+        config['counts']['upload'] = profile['upload_count']
+    if profile['length_seconds'] is not None:
+        config['length']['download'] = profile['length_seconds']
+        config['length']['upload'] = profile['length_seconds']
+
+    # upload() จะรอจนครบ upload_max งาน จึงต้องตรงกับจำนวนชิ้นที่ส่งจริง
+    config['upload_max'] = len(config['sizes']['upload']) * config['counts']['upload']
+
+
+def estimate_confidence(profile: Dict, transferred_bytes: int) -> float:
+    """
+    ประเมินความเชื่อมั่นของผลความเร็วจากโปรไฟล์และปริมาณข้อมูลที่ส่งได้จริง
+
+    Args:
+        profile: ค่าจาก MEASUREMENT_PROFILES
+        transferred_bytes: จำนวนไบต์ที่ดาวน์โหลดและอัปโหลดได้
+
+    Returns:
+        float: ค่าระหว่าง 0 ถึง 1
+    """
+    coverage = min(1.0, transferred_bytes / CONFIDENT_BYTES)
+    return round(profile['confidence'] * coverage, 2)
+
+
 class NetworkQualityCollector:
-    def __init__(self, log_file: str = "network_log.csv"):
+    def __init__(self, log_file: str = "network_log.csv", daily_budget_mb: Optional[float] = None):
         """
         เริ่มต้นระบบเก็บข้อมูล
         
         Args:
             log_file: ชื่อไฟล์ CSV สำหรับบันทึกข้อมูล
+            daily_budget_mb: โควตาข้อมูลต่อวันสำหรับการวัด (MB), None คือไม่จำกัด
         """
         self.log_file = log_file
+        self.daily_budget_mb = daily_budget_mb
         self.setup_csv()
     
     def setup_csv(self):
-        """สร้างไฟล์ CSV และใส่ header ถ้ายังไม่มี"""
+        """สร้างไฟล์ CSV และใส่ header ถ้ายังไม่มี หรือเพิ่มคอลัมน์ใหม่ให้ไฟล์เดิม"""
         if not os.path.exists(self.log_file):
             with open(self.log_file, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.writer(file)
-                writer.writerow([
-                    'timestamp',
-                    'ping_ms',
-                    'download_mbps',
-                    'upload_mbps',
-                    'server_name',
-                    'server_location',
-                    'status'
-                ])
+                writer.writerow(CSV_HEADER)
+            return
+
+        with open(self.log_file, 'r', newline='', encoding='utf-8') as file:
+            rows = list(csv.reader(file))
+
+        if not rows or len(rows[0]) >= len(CSV_HEADER):
+            return
+
+        # ไฟล์รุ่นเก่ายังไม่มีคอลัมน์ profile/bytes_used/confidence
+        with open(self.log_file, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(CSV_HEADER)
+            for row in rows[1:]:
+                writer.writerow(row + [''] * (len(CSV_HEADER) - len(row)))
     
-    def run_speedtest(self) -> Dict:
+    def run_speedtest(self, profile: str = 'full', st: Optional[speedtest.Speedtest] = None,
+                      servers: Optional[list] = None) -> Dict:
         """
         ทำการทดสอบความเร็วเครือข่าย
         
+        Args:
+            profile: ชื่อโปรไฟล์การวัด (full, light, latency)
+            st: อ็อบเจ็กต์ Speedtest ที่เตรียมไว้แล้ว, None คือสร้างใหม่
+            servers: รายชื่อเซิร์ฟเวอร์ให้เลือก, None คือให้ speedtest เลือกเอง
+        
         Returns:
             Dict: ผลการทดสอบ
         """
+        settings = MEASUREMENT_PROFILES[profile]
+
         try:
-            print("🔍 กำลังทดสอบความเร็วเครือข่าย...")
+            print(f"🔍 กำลังทดสอบความเร็วเครือข่าย (โปรไฟล์: {profile})...")
+
+            if st is None:
+                st = speedtest.Speedtest()
+            server = st.get_best_server(servers)
+            ping_ms = round(st.results.ping, 2)
 
-            st = speedtest.Speedtest()
-            server = st.get_best_server()
-            download = st.download()
-            upload = st.upload()
-            ping = st.results.ping
+            if not settings['throughput']:
+                return {
+                    'ping_ms': ping_ms,
+                    'download_mbps': '',
+                    'upload_mbps': '',
+                    'server_name': server['name'],
+                    'server_location': f"{server['country']}, {server['name']}",
+                    'status': 'success',
+                    'profile': profile,
+                    'bytes_used': OVERHEAD_BYTES,
+                    'confidence': ''
+                }
 
-            download_mbps = round(download / 1_000_000, 2)
-            upload_mbps = round(upload / 1_000_000, 2)
-            ping_ms = round(ping, 2)
+            apply_profile(st, settings)
+            download = st.download(threads=settings['threads'])
+            upload = st.upload(threads=settings['threads'])
+
+            transferred = st.results.bytes_received + st.results.bytes_sent
 
             return {
                 'ping_ms': ping_ms,
-                'download_mbps': download_mbps,
-                'upload_mbps': upload_mbps,
+                'download_mbps': round(download / 1_000_000, 2),
+                'upload_mbps': round(upload / 1_000_000, 2),
                 'server_name': server['name'],
                 'server_location': f"{server['country']}, {server['name']}",
-                'status': 'success'
+                'status': 'success',
+                'profile': profile,
+                'bytes_used': transferred + OVERHEAD_BYTES,
+                'confidence': estimate_confidence(settings, transferred)
             }
 
         except Exception as e:
@@ -76,9 +206,80 @@ class NetworkQualityCollector:
                 'upload_mbps': 0,
                 'server_name': 'N/A',
                 'server_location': 'N/A',
-                'status': 'error'
+                'status': 'error',
+                'profile': profile,
+                'bytes_used': 0,
+                'confidence': 0
             }
     
+    def bytes_used_today(self) -> int:
+        """
+        รวมปริมาณข้อมูลที่ใช้วัดไปแล้วในวันนี้
+        
+        Returns:
+            int: จำนวนไบต์
+        """
+        if not os.path.exists(self.log_file):
+            return 0
+
+        today = datetime.date.today().strftime('%Y-%m-%d')
+        total = 0
+        with open(self.log_file, 'r', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                if row['timestamp'].startswith(today) and row.get('bytes_used'):
+                    total += int(float(row['bytes_used']))
+        return total
+    
+    def expected_bytes(self, profile: str, history: int = 10) -> int:
+        """
+        ประมาณการใช้ข้อมูลของโปรไฟล์จากผลการวัดล่าสุด
+        
+        Args:
+            profile: ชื่อโปรไฟล์การวัด
+            history: จำนวนการวัดล่าสุดที่นำมาเฉลี่ย
+        
+        Returns:
+            int: จำนวนไบต์ที่คาดว่าจะใช้
+        """
+        samples = []
+        if os.path.exists(self.log_file):
+            with open(self.log_file, 'r', encoding='utf-8') as file:
+                for row in csv.DictReader(file):
+                    if (row.get('profile') == profile and row['status'] == 'success'
+                            and row.get('bytes_used')):
+                        samples.append(int(float(row['bytes_used'])))
+
+        samples = samples[-history:]
+        if not samples:
+            return MEASUREMENT_PROFILES[profile]['expected_bytes'] + OVERHEAD_BYTES
+        return int(sum(samples) / len(samples))
+    
+    def choose_profile(self, interval_minutes: int = 30) -> str:
+        """
+        เลือกโปรไฟล์ที่ละเอียดที่สุดโดยกระจายโควตาที่เหลือให้ทุกรอบจนถึงเที่ยงคืน
+        
+        Args:
+            interval_minutes: ช่วงเวลาระหว่างการเก็บข้อมูล (นาที)
+        
+        Returns:
+            str: ชื่อโปรไฟล์
+        """
+        if self.daily_budget_mb is None:
+            return 'full'
+
+        now = datetime.datetime.now()
+        midnight = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time())
+        minutes_left = (midnight - now).total_seconds() / 60
+        rounds_left = max(1, math.ceil(minutes_left / interval_minutes))
+
+        remaining = self.daily_budget_mb * 1_000_000 - self.bytes_used_today()
+        allowance = remaining / rounds_left
+
+        for profile in PROFILE_ORDER[:-1]:
+            if self.expected_bytes(profile) <= allowance:
+                return profile
+        return PROFILE_ORDER[-1]
+    
     def save_to_csv(self, data: Dict):
         """
         บันทึกข้อมูลลงไฟล์ CSV
@@ -97,24 +298,39 @@ class NetworkQualityCollector:
                 data['upload_mbps'],
                 data['server_name'],
                 data['server_location'],
-                data['status']
+                data['status'],
+                data['profile'],
+                data['bytes_used'],
+                data['confidence']
             ])
     
-    def collect_once(self):
-        """เก็บข้อมูลหนึ่งครั้ง"""
+    def collect_once(self, profile: Optional[str] = None, interval_minutes: int = 30):
+        """
+        เก็บข้อมูลหนึ่งครั้ง
+        
+        Args:
+            profile: ชื่อโปรไฟล์การวัด, None คือเลือกตามโควตาข้อมูล
+            interval_minutes: ช่วงเวลาระหว่างการเก็บข้อมูล ใช้กระจายโควตา (นาที)
+        """
         timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         print(f"\n📊 [{timestamp}] เริ่มเก็บข้อมูลเครือข่าย")
         
+        if profile is None:
+            profile = self.choose_profile(interval_minutes)
+        
         # ทำการทดสอบ
-        result = self.run_speedtest()
+        result = self.run_speedtest(profile)
         
         # แสดงผล
         if result['status'] == 'success':
             print(f"✅ ผลการทดสอบ:")
             print(f"   🏓 Ping: {result['ping_ms']} ms")
-            print(f"   ⬇️  Download: {result['download_mbps']} Mbps")
-            print(f"   ⬆️  Upload: {result['upload_mbps']} Mbps")
+            if MEASUREMENT_PROFILES[profile]['throughput']:
+                print(f"   ⬇️  Download: {result['download_mbps']} Mbps")
+                print(f"   ⬆️  Upload: {result['upload_mbps']} Mbps")
+                print(f"   🎯 Confidence: {result['confidence']}")
             print(f"   🖥️  Server: {result['server_location']}")
+            print(f"   📦 Data used: {result['bytes_used'] / 1_000_000:.2f} MB ({profile})")
         else:
             print(f"❌ การทดสอบล้มเหลว: {result['status']}")
         
@@ -132,11 +348,13 @@ class NetworkQualityCollector:
             interval_minutes: ช่วงเวลาระหว่างการเก็บข้อมูล (นาที)
         """
         print(f"🔄 เริ่มเก็บข้อมูลต่อเนื่องทุก {interval_minutes} นาที")
+        if self.daily_budget_mb is not None:
+            print(f"📦 โควตาข้อมูลต่อวัน: {self.daily_budget_mb} MB")
         print("⏹️  กด Ctrl+C เพื่อหยุด")
         
         try:
             while True:
-                self.collect_once()
+                self.collect_once(interval_minutes=interval_minutes)
                 print(f"⏰ รอ {interval_minutes} นาที...")
                 time.sleep(interval_minutes * 60)
                 
@@ -167,14 +385,15 @@ class NetworkQualityCollector:
             
             # แสดง header
             header = data[0]
-            print(f"{'เวลา':<20} {'Ping':<8} {'Down':<8} {'Up':<8} {'สถานะ':<10}")
+            print(f"{'เวลา':<20} {'Ping':<8} {'Down':<8} {'Up':<8} {'สถานะ':<10} {'โปรไฟล์':<8}")
             print("-" * 80)
             
             # แสดงข้อมูลล่าสุด
             recent_data = data[-lines:] if len(data) > lines else data[1:]
             for row in recent_data:
                 if len(row) >= 7:
-                    print(f"{row[0]:<20} {row[1]:<8} {row[2]:<8} {row[3]:<8} {row[6]:<10}")
+                    profile = row[7] if len(row) > 7 else ''
+                    print(f"{row[0]:<20} {row[1]:<8} {row[2]:<8} {row[3]:<8} {row[6]:<10} {profile:<8}")
 
 
 def main():
@@ -187,8 +406,10 @@ def main():
         print("=" * 50)
         print("\nการใช้งาน:")
         print("  python collect_data.py once           - เก็บข้อมูล 1 ครั้ง")
+        print("  python collect_data.py once light     - เก็บข้อมูล 1 ครั้งด้วยโปรไฟล์ full, light หรือ latency")
         print("  python collect_data.py continuous     - เก็บข้อมูลต่อเนื่องทุก 30 นาที")
         print("  python collect_data.py continuous 15  - เก็บข้อมูลต่อเนื่องทุก 15 นาที")
+        print("  python collect_data.py continuous 15 500 - ทุก 15 นาที โดยใช้ข้อมูลไม่เกิน 500 MB ต่อวัน")
         print("  python collect_data.py show          - แสดงข้อมูลล่าสุด")
         print("  python collect_data.py show 20       - แสดงข้อมูล 20 ครั้งล่าสุด")
         print("\n📋 ข้อมูลจะถูกบันทึกในไฟล์ 'network_log.csv'")
@@ -197,7 +418,13 @@ def main():
     command = sys.argv[1].lower()
     
     if command == "once":
-        collector.collect_once()
+        profile = 'full'
+        if len(sys.argv) > 2:
+            profile = sys.argv[2].lower()
+            if profile not in MEASUREMENT_PROFILES:
+                print(f"❌ โปรไฟล์ต้องเป็น {', '.join(PROFILE_ORDER)}")
+                return
+        collector.collect_once(profile)
         
     elif command == "continuous":
         interval = 30
@@ -207,6 +434,12 @@ def main():
             except ValueError:
                 print("❌ ช่วงเวลาต้องเป็นตัวเลข")
                 return
+        if len(sys.argv) > 3:
+            try:
+                collector.daily_budget_mb = float(sys.argv[3])
+            except ValueError:
+                print("❌ โควตาข้อมูลต้องเป็นตัวเลข")
+                return
         collector.collect_continuous(interval)
         
     elif command == "show":
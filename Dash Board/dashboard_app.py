@@ -9,7 +9,7 @@ app.title = "Network Quality Dashboard"
 
 def load_data():
     if not os.path.exists("network_log.csv"):
-        return pd.DataFrame(columns=["timestamp", "ping_ms", "download_mbps", "upload_mbps", "server_name", "server_location", "status"])
+        return pd.DataFrame(columns=["timestamp", "ping_ms", "download_mbps", "upload_mbps", "server_name", "server_location", "status", "profile", "bytes_used", "confidence"])
     
     df = pd.read_csv("network_log.csv")
 
@@ -88,7 +88,7 @@ class NetworkDashboard:
         axes[0].set_title('🏓 Ping (ms)', fontsize=12, fontweight='bold')
         axes[0].set_ylabel('Ping (ms)')
         axes[0].grid(True, alpha=0.3)
-        axes[0].set_ylim(0, max(filtered_data['ping_ms']) * 1.1)
+        axes[0].set_ylim(0, filtered_data['ping_ms'].max() * 1.1)
         
         # กราฟ Download Speed
         axes[1].plot(filtered_data['timestamp'], filtered_data['download_mbps'], 
@@ -96,7 +96,7 @@ class NetworkDashboard:
         axes[1].set_title('⬇️ Download Speed (Mbps)', fontsize=12, fontweight='bold')
         axes[1].set_ylabel('Download (Mbps)')
         axes[1].grid(True, alpha=0.3)
-        axes[1].set_ylim(0, max(filtered_data['download_mbps']) * 1.1)
+        axes[1].set_ylim(0, filtered_data['download_mbps'].max() * 1.1)
         
         # กราฟ Upload Speed
         axes[2].plot(filtered_data['timestamp'], filtered_data['upload_mbps'], 
@@ -105,7 +105,7 @@ class NetworkDashboard:
         axes[2].set_ylabel('Upload (Mbps)')
         axes[2].set_xlabel('Time')
         axes[2].grid(True, alpha=0.3)
-        axes[2].set_ylim(0, max(filtered_data['upload_mbps']) * 1.1)
+        axes[2].set_ylim(0, filtered_data['upload_mbps'].max() * 1.1)
         
         # ตั้งค่าการแสดงเวลา
         for ax in axes:
@@ -131,42 +131,42 @@ class NetworkDashboard:
         fig.suptitle('Network Statistics & Distribution', fontsize=16, fontweight='bold')
         
         # Histogram - Ping
-        axes[0,0].hist(self.data['ping_ms'], bins=20, color='red', alpha=0.7, edgecolor='black')
+        axes[0,0].hist(self.data['ping_ms'].dropna(), bins=20, color='red', alpha=0.7, edgecolor='black')
         axes[0,0].set_title('🏓 Ping Distribution')
         axes[0,0].set_xlabel('Ping (ms)')
         axes[0,0].set_ylabel('Frequency')
         axes[0,0].grid(True, alpha=0.3)
         
         # Histogram - Download
-        axes[0,1].hist(self.data['download_mbps'], bins=20, color='green', alpha=0.7, edgecolor='black')
+        axes[0,1].hist(self.data['download_mbps'].dropna(), bins=20, color='green', alpha=0.7, edgecolor='black')
         axes[0,1].set_title('⬇️ Download Speed Distribution')
         axes[0,1].set_xlabel('Download (Mbps)')
         axes[0,1].set_ylabel('Frequency')
         axes[0,1].grid(True, alpha=0.3)
         
         # Histogram - Upload
-        axes[0,2].hist(self.data['upload_mbps'], bins=20, color='blue', alpha=0.7, edgecolor='black')
+        axes[0,2].hist(self.data['upload_mbps'].dropna(), bins=20, color='blue', alpha=0.7, edgecolor='black')
         axes[0,2].set_title('⬆️ Upload Speed Distribution')
         axes[0,2].set_xlabel('Upload (Mbps)')
         axes[0,2].set_ylabel('Frequency')
         axes[0,2].grid(True, alpha=0.3)
         
         # Box Plot - Ping
-        axes[1,0].boxplot(self.data['ping_ms'], patch_artist=True, 
+        axes[1,0].boxplot(self.data['ping_ms'].dropna(), patch_artist=True, 
                          boxprops=dict(facecolor='red', alpha=0.7))
         axes[1,0].set_title('🏓 Ping Box Plot')
         axes[1,0].set_ylabel('Ping (ms)')
         axes[1,0].grid(True, alpha=0.3)
         
         # Box Plot - Download
-        axes[1,1].boxplot(self.data['download_mbps'], patch_artist=True, 
+        axes[1,1].boxplot(self.data['download_mbps'].dropna(), patch_artist=True, 
                          boxprops=dict(facecolor='green', alpha=0.7))
         axes[1,1].set_title('⬇️ Download Box Plot')
         axes[1,1].set_ylabel('Download (Mbps)')
         axes[1,1].grid(True, alpha=0.3)
         
         # Box Plot - Upload
-        axes[1,2].boxplot(self.data['upload_mbps'], patch_artist=True, 
+        axes[1,2].boxplot(self.data['upload_mbps'].dropna(), patch_artist=True, 
                          boxprops=dict(facecolor='blue', alpha=0.7))
         axes[1,2].set_title('⬆️ Upload Box Plot')
         axes[1,2].set_ylabel('Upload (Mbps)')
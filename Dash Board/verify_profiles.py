@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+verify_profiles.py - สคริปต์ตรวจความแม่นยำของโปรไฟล์การวัด
+จำลองเซิร์ฟเวอร์ speedtest ภายในเครื่องที่จำกัดความเร็วไว้ แล้วเทียบผลโปรไฟล์ light กับ full
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+import speedtest
+
+from collect_data import MEASUREMENT_PROFILES, NetworkQualityCollector
+
+CHUNK_SIZE = 10240
+
+
+class TokenBucket:
+    def __init__(self, rate_mbps: float):
+        """
+        ตัวจำกัดความเร็วที่ทุกการเชื่อมต่อใช้ร่วมกัน เหมือนลิงก์จริงหนึ่งเส้น
+
+        Args:
+            rate_mbps: ความเร็วลิงก์ (Mbps)
+        """
+        self.rate = rate_mbps * 1_000_000 / 8
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, size: int):
+        """รอจนกว่าจะส่งข้อมูลขนาด size ไบต์ได้"""
+        with self.lock:
+            now = time.monotonic()
+            # เก็บสะสมได้ไม่เกิน 1 chunk เพื่อไม่ให้เกิด burst
+            self.tokens = min(CHUNK_SIZE, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= size
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """จำลอง Speedtest Mini: latency.txt, random{N}x{N}.jpg และ upload.php"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_text(self, text: str):
+        body = text.encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        path = self.path.split('?')[0]
+
+        if path.endswith('/latency.txt'):
+            self._send_text('test=test')
+            return
+
+        match = re.search(r'/random(\d+)x\d+\.jpg$', path)
+        if not match:
+            # หน้าแรกให้ set_mini_server() หานามสกุลของ upload
+            self._send_text('upload_extension: "php"')
+            return
+
+        # ไฟล์ของ speedtest.net มีขนาดราว 2 ไบต์ต่อพิกเซล
+        size = int(match.group(1)) ** 2 * 2
+        self.send_response(200)
+        self.send_header('Content-Length', str(size))
+        self.end_headers()
+
+        chunk = b'0' * CHUNK_SIZE
+        sent = 0
+        try:
+            while sent < size:
+                part = chunk[:size - sent]
+                self.server.downlink.consume(len(part))
+                self.wfile.write(part)
+                sent += len(part)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def do_POST(self):
+        time.sleep(self.server.latency)
+        size = int(self.headers.get('Content-Length', 0))
+
+        received = 0
+        try:
+            while received < size:
+                part = self.rfile.read(min(CHUNK_SIZE, size - received))
+                if not part:
+                    break
+                self.server.uplink.consume(len(part))
+                received += len(part)
+            self._send_text(f'size={received}')
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, download_mbps: float, upload_mbps: float, latency_ms: float):
+        """
+        เริ่มต้นเซิร์ฟเวอร์จำลองบนพอร์ตว่างของ 127.0.0.1
+
+        Args:
+            download_mbps: ความเร็วดาวน์โหลดของลิงก์จำลอง (Mbps)
+            upload_mbps: ความเร็วอัปโหลดของลิงก์จำลอง (Mbps)
+            latency_ms: หน่วงเวลาก่อนตอบแต่ละคำขอ (ms)
+        """
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.downlink = TokenBucket(download_mbps)
+        self.uplink = TokenBucket(upload_mbps)
+        self.latency = latency_ms / 1000
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}/'
+
+
+class LocalSpeedtest(speedtest.Speedtest):
+    """Speedtest ที่ไม่ต้องโหลด config จาก speedtest.net"""
+
+    def get_config(self):
+        # ค่าเดียวกับที่ speedtest.net ส่งให้โดยทั่วไป (threadcount=4, ratio=5, maxchunkcount=50)
+        self.config.update({
+            'client': {'ip': '127.0.0.1', 'isp': 'localhost', 'lat': '0', 'lon': '0'},
+            'ignore_servers': [],
+            'sizes': {
+                'upload': [524288, 1048576, 7340032],
+                'download': [350, 500, 750, 1000, 1500, 2000, 2500, 3000, 3500, 4000]
+            },
+            'counts': {'upload': 17, 'download': 4},
+            'threads': {'upload': 2, 'download': 8},
+            'length': {'upload': 10, 'download': 10},
+            'upload_max': 51
+        })
+        self.lat_lon = (0.0, 0.0)
+        return self.config
+
+
+def measure(collector: NetworkQualityCollector, server: StandInServer, profile: str) -> Dict:
+    """วัดหนึ่งครั้งกับเซิร์ฟเวอร์จำลองด้วยโปรไฟล์ที่กำหนด"""
+    st = LocalSpeedtest()
+    servers = st.set_mini_server(server.url)
+    for entry in servers:
+        entry['country'] = 'Local'
+    return collector.run_speedtest(profile, st=st, servers=servers)
+
+
+def relative_error(value: float, reference: float) -> float:
+    return abs(value - reference) / reference * 100
+
+
+def verify(download_mbps: float = 50, upload_mbps: float = 20, latency_ms: float = 20, rounds: int = 3):
+    """
+    เทียบผลทุกโปรไฟล์กับความเร็วจริงของลิงก์จำลองและกับโปรไฟล์ full
+
+    Args:
+        download_mbps: ความเร็วดาวน์โหลดของลิงก์จำลอง (Mbps)
+        upload_mbps: ความเร็วอัปโหลดของลิงก์จำลอง (Mbps)
+        latency_ms: หน่วงเวลาก่อนตอบแต่ละคำขอ (ms)
+        rounds: จำนวนรอบที่วัดต่อโปรไฟล์
+    """
+    server = StandInServer(download_mbps, upload_mbps, latency_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # ไม่บันทึกผลลงไฟล์ ใช้เพียง run_speedtest()
+    collector = NetworkQualityCollector(log_file=os.devnull)
+
+    print(f"🧪 ลิงก์จำลอง: ⬇️ {download_mbps} Mbps, ⬆️ {upload_mbps} Mbps, หน่วง {latency_ms} ms")
+
+    averages = {}
+    for profile, settings in MEASUREMENT_PROFILES.items():
+        if not settings['throughput']:
+            continue
+
+        results: List[Dict] = []
+        for _ in range(rounds):
+            result = measure(collector, server, profile)
+            if result['status'] != 'success':
+                print(f"❌ โปรไฟล์ {profile} วัดไม่สำเร็จ")
+                server.shutdown()
+                return
+            results.append(result)
+
+        averages[profile] = {
+            key: sum(r[key] for r in results) / rounds
+            for key in ('download_mbps', 'upload_mbps', 'bytes_used', 'confidence')
+        }
+
+    server.shutdown()
+
+    print("\n📊 ผลเฉลี่ย:")
+    print(f"{'โปรไฟล์':<10} {'Down':<8} {'Up':<8} {'MB':<8} {'Conf':<6} {'Err Down %':<11} {'Err Up %':<9}")
+    print("-" * 70)
+    for profile, avg in averages.items():
+        print(f"{profile:<10} {avg['download_mbps']:<8.2f} {avg['upload_mbps']:<8.2f} "
+              f"{avg['bytes_used'] / 1_000_000:<8.2f} {avg['confidence']:<6.2f} "
+              f"{relative_error(avg['download_mbps'], download_mbps):<11.1f} "
+              f"{relative_error(avg['upload_mbps'], upload_mbps):<9.1f}")
+
+    full = averages['full']
+    for profile, avg in averages.items():
+        if profile == 'full':
+            continue
+        print(f"\n🎯 {profile} เทียบกับ full:")
+        print(f"   ⬇️  Download ต่างกัน {relative_error(avg['download_mbps'], full['download_mbps']):.1f}%")
+        print(f"   ⬆️  Upload ต่างกัน {relative_error(avg['upload_mbps'], full['upload_mbps']):.1f}%")
+        print(f"   📦 ใช้ข้อมูล {avg['bytes_used'] / full['bytes_used'] * 100:.1f}% ของ full")
+
+
+def main():
+    """ฟังก์ชันหลักสำหรับรันสคริปต์"""
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print("การใช้งาน:")
+        print("  python verify_profiles.py               - ลิงก์จำลอง 50/20 Mbps หน่วง 20 ms")
+        print("  python verify_profiles.py 100 40 30     - กำหนด download upload (Mbps) และหน่วง (ms)")
+        return
+
+    try:
+        values = [float(arg) for arg in sys.argv[1:4]]
+    except ValueError:
+        print("❌ ค่าความเร็วและหน่วงเวลาต้องเป็นตัวเลข")
+        return
+
+    verify(*values)
+
+
+if __name__ == "__main__":
+    main()